@@ -183,6 +183,7 @@ async def _async_main(
             include_submodules=include_submodules,
             token=token,
             output=output_target,
+            stream_output=True,
         )
     except Exception as exc:
         # Convert any exception into Click.Abort so that exit status is non-zero
@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import git
-
 from gitingest.config import DEFAULT_TIMEOUT
 from gitingest.utils.git_utils import (
     check_repo_exists,
     checkout_partial_clone,
-    create_git_repo,
-    ensure_git_installed,
-    git_auth_context,
-    is_github_host,
+    create_git_auth_env,
+    get_git_capabilities,
     resolve_commit,
+    run_command,
 )
 from gitingest.utils.logging_config import get_logger
 from gitingest.utils.os_utils import ensure_directory_exists_or_create
@@ -27,6 +25,15 @@ if TYPE_CHECKING:
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# First Git version supporting ``git clone --revision``, which fetches and checks out a commit in one step
+_CLONE_REVISION_MIN_GIT_VERSION = (2, 49)
+
+# First Git version supporting ``git submodule update --jobs``
+_SUBMODULE_JOBS_MIN_GIT_VERSION = (2, 9)
+
+# Subpaths at least this many directories deep are cloned without trees (``--filter=tree:0``)
+_TREE_FILTER_MIN_DEPTH = 2
+
 
 @async_timeout(DEFAULT_TIMEOUT)
 async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
@@ -51,10 +58,14 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
         If Git operations fail during the cloning process.
 
     """
+    logger.debug("Detecting git capabilities")
+    caps = await get_git_capabilities()
+
     # Extract and validate query parameters
     url: str = config.url
     local_path: str = config.local_path
-    partial_clone: bool = config.subpath != "/"
+    # Without sparse-checkout support, fall back to a full clone; ingestion still only reads the subpath.
+    partial_clone: bool = config.subpath != "/" and caps.supports_sparse
 
     logger.info(
         "Starting git clone operation",
@@ -70,9 +81,6 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
         },
     )
 
-    logger.debug("Ensuring git is installed")
-    await ensure_git_installed()
-
     logger.debug("Creating local directory", extra={"parent_path": str(Path(local_path).parent)})
     await ensure_directory_exists_or_create(Path(local_path).parent)
 
@@ -86,34 +94,27 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
     commit = await resolve_commit(config, token=token)
     logger.debug("Resolved commit", extra={"commit": commit})
 
-    # Clone the repository using GitPython with proper authentication
+    env = create_git_auth_env(url, token)
+
+    # Recent Git clones straight at the commit, saving the separate fetch and checkout round-trips
+    clone_at_revision = caps.version >= _CLONE_REVISION_MIN_GIT_VERSION
+
+    clone_cmd = ["git", "clone", "--single-branch", "--depth=1"]
+    clone_cmd += [f"--revision={commit}"] if clone_at_revision else ["--no-checkout"]
+    if partial_clone:
+        if caps.supports_filter:
+            clone_cmd += [f"--filter={_partial_clone_filter(config)}"]
+        clone_cmd += ["--sparse"]
+    clone_cmd += [url, local_path]
+
+    # Clone the repository
     logger.info("Executing git clone operation", extra={"url": "<redacted>", "local_path": local_path})
     try:
-        clone_kwargs = {
-            "single_branch": True,
-            "no_checkout": True,
-            "depth": 1,
-        }
-
-        with git_auth_context(url, token) as (git_cmd, auth_url):
-            if partial_clone:
-                # For partial clones, use git.Git() with filter and sparse options
-                cmd_args = ["--single-branch", "--no-checkout", "--depth=1"]
-                cmd_args.extend(["--filter=blob:none", "--sparse"])
-                cmd_args.extend([auth_url, local_path])
-                git_cmd.clone(*cmd_args)
-            elif token and is_github_host(url):
-                # For authenticated GitHub repos, use git_cmd with auth URL
-                cmd_args = ["--single-branch", "--no-checkout", "--depth=1", auth_url, local_path]
-                git_cmd.clone(*cmd_args)
-            else:
-                # For non-authenticated repos, use the standard GitPython method
-                git.Repo.clone_from(url, local_path, **clone_kwargs)
-
-        logger.info("Git clone completed successfully")
-    except git.GitCommandError as exc:
+        await run_command(*clone_cmd, env=env)
+    except RuntimeError as exc:
         msg = f"Git clone failed: {exc}"
         raise RuntimeError(msg) from exc
+    logger.info("Git clone completed successfully")
 
     # Checkout the subpath if it is a partial clone
     if partial_clone:
@@ -121,18 +122,59 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
         await checkout_partial_clone(config, token=token)
         logger.debug("Partial clone setup completed")
 
+    # Fetch submodules in parallel when supported
+    submodule_jobs = (os.cpu_count() or 4) if caps.version >= _SUBMODULE_JOBS_MIN_GIT_VERSION else None
+
     # Perform post-clone operations
-    await _perform_post_clone_operations(config, local_path, url, token, commit)
+    await _perform_post_clone_operations(
+        config,
+        local_path,
+        commit,
+        env,
+        checkout=not clone_at_revision,
+        submodule_jobs=submodule_jobs,
+    )
 
     logger.info("Git clone operation completed successfully", extra={"local_path": local_path})
 
 
+def _partial_clone_filter(config: CloneConfig) -> str:
+    """Choose the ``--filter`` spec for a partial clone of ``config.subpath``.
+
+    Deep subpaths only need the trees along a single path, so ``tree:0`` skips fetching every other tree up front;
+    the sparse checkout then lazily fetches exactly the trees it needs. Shallow subpaths use ``blob:none``, which still
+    downloads all trees but avoids the extra round-trips of lazy tree fetches.
+
+    Parameters
+    ----------
+    config : CloneConfig
+        The configuration for cloning the repository.
+
+    Returns
+    -------
+    str
+        The filter spec to pass to ``git clone --filter``.
+
+    """
+    sparse_path = Path(config.subpath.strip("/"))
+    if config.blob:
+        # Only the parent directory of a file is checked out (see ``checkout_partial_clone``)
+        sparse_path = sparse_path.parent
+
+    if len(sparse_path.parts) >= _TREE_FILTER_MIN_DEPTH:
+        return "tree:0"
+
+    return "blob:none"
+
+
 async def _perform_post_clone_operations(
     config: CloneConfig,
     local_path: str,
-    url: str,
-    token: str | None,
     commit: str,
+    env: dict[str, str] | None,
+    *,
+    checkout: bool = True,
+    submodule_jobs: int | None = None,
 ) -> None:
     """Perform post-clone operations like fetching, checkout, and submodule updates.
 
@@ -142,12 +184,14 @@ async def _perform_post_clone_operations(
         The configuration for cloning the repository.
     local_path : str
         The local path where the repository was cloned.
-    url : str
-        The repository URL.
-    token : str | None
-        GitHub personal access token (PAT) for accessing private repositories.
     commit : str
         The commit SHA to checkout.
+    env : dict[str, str] | None
+        Environment for the ``git`` subprocesses, carrying the authentication header if needed.
+    checkout : bool
+        Whether to fetch and check out ``commit``. Skipped when the clone already checked it out (default: ``True``).
+    submodule_jobs : int | None
+        Number of submodules to fetch in parallel, or ``None`` to let Git fetch them one at a time (default: ``None``).
 
     Raises
     ------
@@ -155,22 +199,23 @@ async def _perform_post_clone_operations(
         If any Git operation fails.
 
     """
+    git = ["git", "-C", local_path]
     try:
-        repo = create_git_repo(local_path, url, token)
-
-        # Ensure the commit is locally available
-        logger.debug("Fetching specific commit", extra={"commit": commit})
-        repo.git.fetch("--depth=1", "origin", commit)
+        if checkout:
+            # Ensure the commit is locally available
+            logger.debug("Fetching specific commit", extra={"commit": commit})
+            await run_command(*git, "fetch", "--depth=1", "origin", commit, env=env)
 
-        # Write the work-tree at that commit
-        logger.info("Checking out commit", extra={"commit": commit})
-        repo.git.checkout(commit)
+            # Write the work-tree at that commit
+            logger.info("Checking out commit", extra={"commit": commit})
+            await run_command(*git, "checkout", commit, env=env)
 
         # Update submodules
         if config.include_submodules:
-            logger.info("Updating submodules")
-            repo.git.submodule("update", "--init", "--recursive", "--depth=1")
+            logger.info("Updating submodules", extra={"jobs": submodule_jobs})
+            jobs = [f"--jobs={submodule_jobs}"] if submodule_jobs else []
+            await run_command(*git, "submodule", "update", "--init", "--recursive", *jobs, "--depth=1", env=env)
             logger.debug("Submodules updated successfully")
-    except git.GitCommandError as exc:
+    except RuntimeError as exc:
         msg = f"Git operation failed: {exc}"
         raise RuntimeError(msg) from exc
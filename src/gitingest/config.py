@@ -2,13 +2,14 @@
 
 import tempfile
 from pathlib import Path
+from typing import Final
 
-MAX_FILE_SIZE = 10 * 1024 * 1024  # Maximum size of a single file to process (10 MB)
-MAX_DIRECTORY_DEPTH = 20  # Maximum depth of directory traversal
-MAX_FILES = 10_000  # Maximum number of files to process
-MAX_TOTAL_SIZE_BYTES = 500 * 1024 * 1024  # Maximum size of output file (500 MB)
-DEFAULT_TIMEOUT = 60  # seconds
+MAX_FILE_SIZE: Final = 10 * 1024 * 1024  # Maximum size of a single file to process (10 MB)
+MAX_DIRECTORY_DEPTH: Final = 20  # Maximum depth of directory traversal
+MAX_FILES: Final = 10_000  # Maximum number of files to process
+MAX_TOTAL_SIZE_BYTES: Final = 500 * 1024 * 1024  # Maximum size of output file (500 MB)
+DEFAULT_TIMEOUT: Final = 60  # seconds
 
-OUTPUT_FILE_NAME = "digest.txt"
+OUTPUT_FILE_NAME: Final = "digest.txt"
 
-TMP_BASE_PATH = Path(tempfile.gettempdir()) / "gitingest"
+TMP_BASE_PATH: Final = Path(tempfile.gettempdir()) / "gitingest"
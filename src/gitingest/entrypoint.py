@@ -7,9 +7,10 @@ import errno
 import shutil
 import stat
 import sys
-from contextlib import asynccontextmanager
+import uuid
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, AsyncGenerator, Callable
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Generator, TextIO
 from urllib.parse import urlparse
 
 from gitingest.clone import clone_repo
@@ -44,6 +45,7 @@ async def ingest_async(
     include_submodules: bool = False,
     token: str | None = None,
     output: str | None = None,
+    stream_output: bool = False,
 ) -> tuple[str, str, str]:
     """Ingest a source and process its contents.
 
@@ -76,6 +78,9 @@ async def ingest_async(
         File path where the summary and content should be written.
         If ``"-"`` (dash), the results are written to ``stdout``.
         If ``None``, the results are not written to a file.
+    stream_output : bool
+        If ``True`` and ``output`` is set, the file contents are written to ``output`` one file at a time instead of
+        being built in memory, and the returned content is empty (default: ``False``).
 
     Returns
     -------
@@ -83,7 +88,7 @@ async def ingest_async(
         A tuple containing:
         - A summary string of the analyzed repository or directory.
         - A tree-like string representation of the file structure.
-        - The content of the files in the repository or directory.
+        - The content of the files in the repository or directory. Empty if ``stream_output`` is used.
 
     """
     logger.info("Starting ingestion process", extra={"source": source})
@@ -138,11 +143,16 @@ async def ingest_async(
             _apply_gitignores(query)
 
         logger.info("Processing files and generating output")
-        summary, tree, content = ingest_query(query)
-
-        if output:
-            logger.debug("Writing output to file", extra={"output_path": output})
-        await _write_output(tree, content=content, target=output)
+        if output and stream_output:
+            logger.debug("Streaming output to file", extra={"output_path": output})
+            with _open_output(output) as output_stream:
+                summary, tree, content = ingest_query(query, output_stream=output_stream)
+        else:
+            summary, tree, content = ingest_query(query)
+            if output:
+                logger.debug("Writing output to file", extra={"output_path": output})
+                with _open_output(output) as output_stream:
+                    output_stream.write(f"{tree}\n{content}")
 
         logger.info("Ingestion completed successfully")
         return summary, tree, content
@@ -160,6 +170,7 @@ def ingest(
     include_submodules: bool = False,
     token: str | None = None,
     output: str | None = None,
+    stream_output: bool = False,
 ) -> tuple[str, str, str]:
     """Provide a synchronous wrapper around ``ingest_async``.
 
@@ -192,6 +203,9 @@ def ingest(
         File path where the summary and content should be written.
         If ``"-"`` (dash), the results are written to ``stdout``.
         If ``None``, the results are not written to a file.
+    stream_output : bool
+        If ``True`` and ``output`` is set, the file contents are written to ``output`` one file at a time instead of
+        being built in memory, and the returned content is empty (default: ``False``).
 
     Returns
     -------
@@ -199,7 +213,7 @@ def ingest(
         A tuple containing:
         - A summary string of the analyzed repository or directory.
         - A tree-like string representation of the file structure.
-        - The content of the files in the repository or directory.
+        - The content of the files in the repository or directory. Empty if ``stream_output`` is used.
 
     See Also
     --------
@@ -218,6 +232,7 @@ def ingest(
             include_submodules=include_submodules,
             token=token,
             output=output,
+            stream_output=stream_output,
         ),
     )
 
@@ -330,23 +345,43 @@ def _handle_remove_readonly(
     func(path)
 
 
-async def _write_output(tree: str, content: str, target: str | None) -> None:
-    """Write combined output to ``target`` (``"-"`` ⇒ stdout).
+@contextmanager
+def _open_output(target: str) -> Generator[TextIO]:
+    """Open the stream the digest is written to (``"-"`` ⇒ stdout).
+
+    A new or regular file is written under a temporary name next to ``target`` and only moved into place once writing
+    succeeded, so a failed ingestion leaves any previous output untouched. Other targets (e.g. ``/dev/stdout``, a FIFO
+    or ``/dev/null``) are opened and written directly.
 
     Parameters
     ----------
-    tree : str
-        The tree-like string representation of the file structure.
-    content : str
-        The content of the files in the repository or directory.
-    target : str | None
-        The path to the output file. If ``None``, the results are not written to a file.
+    target : str
+        The path to the output file, or ``"-"`` for ``stdout``.
+
+    Yields
+    ------
+    TextIO
+        The stream to write the digest to.
 
     """
-    data = f"{tree}\n{content}"
-    loop = asyncio.get_running_loop()
     if target == "-":
-        await loop.run_in_executor(None, sys.stdout.write, data)
-        await loop.run_in_executor(None, sys.stdout.flush)
-    elif target is not None:
-        await loop.run_in_executor(None, Path(target).write_text, data, "utf-8")
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+
+    path = Path(target)
+    if path.exists() and not path.is_file():
+        with path.open("w", encoding="utf-8") as output_stream:
+            yield output_stream
+        return
+
+    path = path.resolve()
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("x", encoding="utf-8") as output_stream:
+            yield output_stream
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
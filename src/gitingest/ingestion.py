@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 from gitingest.config import MAX_DIRECTORY_DEPTH, MAX_FILES, MAX_TOTAL_SIZE_BYTES
 from gitingest.output_formatter import format_node
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
+def ingest_query(query: IngestionQuery, *, output_stream: TextIO | None = None) -> tuple[str, str, str]:
     """Run the ingestion process for a parsed query.
 
     This is the main entry point for analyzing a codebase directory or single file. It processes the query
@@ -29,6 +29,9 @@ def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
     ----------
     query : IngestionQuery
         The parsed query object containing information about the repository and query parameters.
+    output_stream : TextIO | None
+        If provided, the digest is streamed to this stream instead of being built in memory, and the returned file
+        content is empty.
 
     Returns
     -------
@@ -91,7 +94,7 @@ def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
                 "file_size": file_node.size,
             },
         )
-        return format_node(file_node, query=query)
+        return format_node(file_node, query=query, output_stream=output_stream)
 
     logger.info("Processing directory", extra={"directory_path": str(path)})
 
@@ -117,7 +120,7 @@ def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
         },
     )
 
-    return format_node(root_node, query=query)
+    return format_node(root_node, query=query, output_stream=output_stream)
 
 
 def _process_node(node: FileSystemNode, query: IngestionQuery, stats: FileSystemStats) -> None:
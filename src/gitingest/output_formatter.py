@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import ssl
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
 
 import requests.exceptions
 import tiktoken
 
 from gitingest.schemas import FileSystemNode, FileSystemNodeType
-from gitingest.utils.compat_func import readlink
 from gitingest.utils.logging_config import get_logger
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from gitingest.schemas import IngestionQuery
 
 # Initialize logger for this module
@@ -23,8 +31,39 @@ _TOKEN_THRESHOLDS: list[tuple[int, str]] = [
     (1_000, "k"),
 ]
 
+# Token counts of large texts, keyed by a digest of the text, so re-ingesting unchanged content skips the encoding
+_TOKEN_COUNT_CACHE_MIN_CHARS = 64 * 1024
+_TOKEN_COUNT_CACHE_SIZE = 128
+_token_count_cache: OrderedDict[bytes, int] = OrderedDict()
+_token_count_cache_lock = threading.Lock()
+
+# Chunks are tokenized in batches on a small pool shared by all digests in the process, so concurrent ingestions
+# (e.g. on the server) do not each spin up their own threads (tiktoken releases the GIL while encoding)
+_TOKEN_COUNT_BATCH_SIZE = 64
+_TOKEN_COUNT_THREADS = min(4, os.cpu_count() or 1)
+_token_count_executor = ThreadPoolExecutor(max_workers=_TOKEN_COUNT_THREADS, thread_name_prefix="tokens")
+
+# Past this many characters, the remaining chunks are not encoded and their tokens are extrapolated from the rest
+_TOKEN_COUNT_EXACT_CHARS = 50_000_000
+
+# File contents are read ahead once a digest covers more than this many files, on a pool shared by all digests in the
+# process so concurrent ingestions (e.g. on the server) do not each start their own readers
+_CONTENT_READ_MIN_FILES = 64
+_CONTENT_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_content_read_executor = ThreadPoolExecutor(max_workers=_CONTENT_READ_WORKERS, thread_name_prefix="content")
+_get_content_string = attrgetter("content_string")
+
+# Tree connectors and child indentation, indexed by whether the node is the last of its siblings
+_TREE_BRANCH: tuple[str, str] = ("├── ", "└── ")
+_TREE_INDENT: tuple[str, str] = ("│   ", "    ")
 
-def format_node(node: FileSystemNode, query: IngestionQuery) -> tuple[str, str, str]:
+
+def format_node(
+    node: FileSystemNode,
+    query: IngestionQuery,
+    *,
+    output_stream: TextIO | None = None,
+) -> tuple[str, str, str]:
     """Generate a summary, directory structure, and file contents for a given file system node.
 
     If the node represents a directory, the function will recursively process its contents.
@@ -35,6 +74,9 @@ def format_node(node: FileSystemNode, query: IngestionQuery) -> tuple[str, str,
         The file system node to be summarized.
     query : IngestionQuery
         The parsed query object containing information about the repository and query parameters.
+    output_stream : TextIO | None
+        If provided, the digest (directory structure followed by file contents) is written to this stream one file
+        at a time instead of being built in memory, and the returned file contents are empty.
 
     Returns
     -------
@@ -49,13 +91,22 @@ def format_node(node: FileSystemNode, query: IngestionQuery) -> tuple[str, str,
         summary += f"Files analyzed: {node.file_count}\n"
     elif node.type == FileSystemNodeType.FILE:
         summary += f"File: {node.name}\n"
-        summary += f"Lines: {len(node.content.splitlines()):,}\n"
+        summary += f"Lines: {_count_lines(node.content):,}\n"
 
-    tree = "Directory structure:\n" + _create_tree_structure(query, node=node)
+    tree_str, file_nodes = _render_tree(query, node=node)
+    tree = "Directory structure:\n" + tree_str
 
-    content = _gather_file_contents(node)
+    if output_stream is None:
+        file_contents = list(_iter_content_strings(file_nodes))
+        content = "\n".join(file_contents)
+        token_estimate = _format_token_count([tree, *file_contents])
+    else:
+        content = ""
+        chunks = _write_digest(output_stream, tree=tree, file_nodes=file_nodes)
+        token_estimate = _format_token_count(chunks)
+        # Finish writing the digest if token counting gave up early (e.g. the tokenizer could not be loaded)
+        deque(chunks, maxlen=0)
 
-    token_estimate = _format_token_count(tree + content)
     if token_estimate:
         summary += f"\nEstimated tokens: {token_estimate}"
 
@@ -102,89 +153,167 @@ def _create_summary_prefix(query: IngestionQuery, *, single_file: bool = False)
     return "\n".join(parts) + "\n"
 
 
-def _gather_file_contents(node: FileSystemNode) -> str:
-    """Recursively gather contents of all files under the given node.
+def _count_lines(text: str) -> int:
+    """Count the lines in ``text`` without building a list of them.
 
-    This function recursively processes a directory node and gathers the contents of all files
-    under that node. It returns the concatenated content of all files as a single string.
+    Matches ``len(text.splitlines())`` for LF and CRLF line endings.
 
     Parameters
     ----------
-    node : FileSystemNode
-        The current directory or file node being processed.
+    text : str
+        The text to count lines in.
 
     Returns
     -------
-    str
-        The concatenated content of all files under the given node.
+    int
+        The number of lines, not counting an empty line after a trailing newline.
 
     """
-    if node.type != FileSystemNodeType.DIRECTORY:
-        return node.content_string
+    if not text:
+        return 0
+    return text.count("\n") + (0 if text.endswith("\n") else 1)
 
-    # Recursively gather contents of all files under the current directory
-    return "\n".join(_gather_file_contents(child) for child in node.children)
 
+def _render_tree(query: IngestionQuery, *, node: FileSystemNode) -> tuple[str, list[FileSystemNode]]:
+    """Render the directory tree and collect the file nodes under the given node in a single pass.
 
-def _create_tree_structure(
-    query: IngestionQuery,
-    *,
-    node: FileSystemNode,
-    prefix: str = "",
-    is_last: bool = True,
-) -> str:
-    """Generate a tree-like string representation of the file structure.
-
-    This function generates a string representation of the directory structure, formatted
-    as a tree with appropriate indentation for nested directories and files.
+    The node tree is walked depth-first (using an explicit stack rather than recursion). Every node contributes a
+    line to the tree-like representation of the file structure, and every non-directory node is collected in the
+    same order, so file contents can later be emitted in tree order without walking the tree again.
 
     Parameters
     ----------
     query : IngestionQuery
         The parsed query object containing information about the repository and query parameters.
     node : FileSystemNode
-        The current directory or file node being processed.
-    prefix : str
-        A string used for indentation and formatting of the tree structure (default: ``""``).
-    is_last : bool
-        A flag indicating whether the current node is the last in its directory (default: ``True``).
+        The root directory or file node to process.
 
     Returns
     -------
+    tuple[str, list[FileSystemNode]]
+        The directory structure formatted as a tree, and the non-directory nodes in tree order.
+
+    """
+    tree_lines: list[str] = []
+    file_nodes: list[FileSystemNode] = []
+    stack = [(node, "", True)]
+
+    while stack:
+        current, prefix, is_last = stack.pop()
+
+        if not current.name:
+            # If no name is present, use the slug as the top-level directory name
+            current.name = query.slug
+
+        # Indicate directories with a trailing slash
+        is_directory = current.type is FileSystemNodeType.DIRECTORY
+        display_name = current.name
+        if is_directory:
+            display_name += "/"
+        elif current.type is FileSystemNodeType.SYMLINK:
+            display_name += " -> " + current.symlink_target_name
+
+        tree_lines.append(f"{prefix}{_TREE_BRANCH[is_last]}{display_name}\n")
+
+        if not is_directory:
+            file_nodes.append(current)
+            continue
+
+        children = current.children
+        if children:
+            child_prefix = prefix + _TREE_INDENT[is_last]
+            last_index = len(children) - 1
+            # Push children in reverse so they are popped in their sorted order
+            stack.extend((children[i], child_prefix, i == last_index) for i in range(last_index, -1, -1))
+
+    return "".join(tree_lines), file_nodes
+
+
+def _write_digest(output_stream: TextIO, *, tree: str, file_nodes: list[FileSystemNode]) -> Iterator[str]:
+    """Write the directory structure and the content of each file to ``output_stream``.
+
+    Each chunk is yielded right after it has been written, so the caller can inspect it (e.g. count its tokens)
+    without the whole digest ever being held in memory.
+
+    Parameters
+    ----------
+    output_stream : TextIO
+        The stream to write the digest to.
+    tree : str
+        The directory structure formatted as a tree.
+    file_nodes : list[FileSystemNode]
+        The non-directory nodes whose content is written, in tree order.
+
+    Yields
+    ------
     str
-        A string representing the directory structure formatted as a tree.
+        Each chunk of the digest (the tree, then one chunk per file) after it has been written.
 
     """
-    if not node.name:
-        # If no name is present, use the slug as the top-level directory name
-        node.name = query.slug
+    output_stream.write(tree)
+    output_stream.write("\n")
+    yield tree
 
-    tree_str = ""
-    current_prefix = "└── " if is_last else "├── "
+    for i, chunk in enumerate(_iter_content_strings(file_nodes)):
+        if i:
+            output_stream.write("\n")
+        output_stream.write(chunk)
+        yield chunk
 
-    # Indicate directories with a trailing slash
-    display_name = node.name
-    if node.type == FileSystemNodeType.DIRECTORY:
-        display_name += "/"
-    elif node.type == FileSystemNodeType.SYMLINK:
-        display_name += " -> " + readlink(node.path).name
 
-    tree_str += f"{prefix}{current_prefix}{display_name}\n"
+def _iter_content_strings(file_nodes: list[FileSystemNode]) -> Iterator[str]:
+    """Yield the ``content_string`` of each file node, in order.
 
-    if node.type == FileSystemNodeType.DIRECTORY and node.children:
-        prefix += "    " if is_last else "│   "
-        for i, child in enumerate(node.children):
-            tree_str += _create_tree_structure(query, node=child, prefix=prefix, is_last=i == len(node.children) - 1)
-    return tree_str
+    Reading a node's content hits the disk, so for more than ``_CONTENT_READ_MIN_FILES`` files the contents are read
+    ahead on the shared ``_content_read_executor``. At most ``2 * _CONTENT_READ_WORKERS`` files are in flight at once,
+    which keeps memory bounded when the digest is streamed.
 
+    Parameters
+    ----------
+    file_nodes : list[FileSystemNode]
+        The non-directory nodes whose content is read.
 
-def _format_token_count(text: str) -> str | None:
+    Yields
+    ------
+    str
+        The content string of each node, in the order of ``file_nodes``.
+
+    """
+    if len(file_nodes) <= _CONTENT_READ_MIN_FILES:
+        for file_node in file_nodes:
+            yield file_node.content_string
+        return
+
+    remaining = iter(file_nodes)
+    pending: deque[Future[str]] = deque(
+        _content_read_executor.submit(_get_content_string, file_node)
+        for file_node in islice(remaining, 2 * _CONTENT_READ_WORKERS)
+    )
+    try:
+        while pending:
+            chunk = pending.popleft().result()
+            for file_node in islice(remaining, 1):
+                pending.append(_content_read_executor.submit(_get_content_string, file_node))
+            yield chunk
+    finally:
+        # Drop reads that are no longer needed if the caller stops early (e.g. a write error)
+        for future in pending:
+            future.cancel()
+
+
+def _format_token_count(texts: Iterable[str]) -> str | None:
     """Return a human-readable token-count string (e.g. 1.2k, 1.2 M).
 
+    The chunks are encoded in batches of ``_TOKEN_COUNT_BATCH_SIZE`` and their token counts summed, so the caller
+    never has to concatenate them into one (potentially very large) string, and only one batch of token lists is held
+    in memory at a time. Tokens spanning a chunk boundary may be counted slightly differently, which is well within the
+    precision of the estimate. For huge inputs, only the first ``_TOKEN_COUNT_EXACT_CHARS`` characters (rounded up to
+    a whole batch) are encoded; the tokens of the remaining chunks are extrapolated from the ratio observed so far.
+
     Parameters
     ----------
-    text : str
-        The text string for which the token count is to be estimated.
+    texts : Iterable[str]
+        The text chunks for which the total token count is to be estimated.
 
     Returns
     -------
@@ -194,8 +323,7 @@ def _format_token_count(text: str) -> str | None:
     """
     try:
         encoding = tiktoken.get_encoding("o200k_base")  # gpt-4o, gpt-4o-mini
-        total_tokens = len(encoding.encode(text, disallowed_special=()))
-    except (ValueError, UnicodeEncodeError) as exc:
+    except ValueError as exc:
         logger.warning("Failed to estimate token size", extra={"error": str(exc)})
         return None
     except (requests.exceptions.RequestException, ssl.SSLError) as exc:
@@ -203,8 +331,109 @@ def _format_token_count(text: str) -> str | None:
         logger.warning("Failed to download tiktoken model", extra={"error": str(exc)})
         return None
 
+    total_tokens = _estimate_tokens(encoding, texts)
+    if total_tokens is None:
+        return None
+
     for threshold, suffix in _TOKEN_THRESHOLDS:
         if total_tokens >= threshold:
             return f"{total_tokens / threshold:.1f}{suffix}"
 
     return str(total_tokens)
+
+
+def _estimate_tokens(encoding: tiktoken.Encoding, texts: Iterable[str]) -> int | None:
+    """Return the total number of tokens in ``texts``, encoding them in batches.
+
+    Once ``_TOKEN_COUNT_EXACT_CHARS`` characters have been encoded, the remaining chunks are still consumed (so a
+    streamed digest is written in full) but only their length is used, scaled by the tokens-per-character ratio of the
+    chunks encoded so far. Only encoding errors are handled here: iterating ``texts`` may write a streamed digest, and
+    errors raised by that write must reach the caller.
+
+    Parameters
+    ----------
+    encoding : tiktoken.Encoding
+        The encoding used to tokenize the texts.
+    texts : Iterable[str]
+        The text chunks to count tokens in.
+
+    Returns
+    -------
+    int | None
+        The (estimated) total number of tokens in ``texts``, or ``None`` if a chunk could not be encoded. In that case
+        the remaining chunks are left unconsumed.
+
+    """
+    total_tokens = 0
+    encoded_chars = 0
+    chunks = iter(texts)
+
+    while encoded_chars < _TOKEN_COUNT_EXACT_CHARS:
+        batch = list(islice(chunks, _TOKEN_COUNT_BATCH_SIZE))
+        if not batch:
+            return total_tokens
+        try:
+            total_tokens += _count_tokens(encoding, batch)
+        except (ValueError, UnicodeEncodeError) as exc:
+            logger.warning("Failed to estimate token size", extra={"error": str(exc)})
+            return None
+        encoded_chars += sum(map(len, batch))
+
+    skipped_chars = sum(map(len, chunks))
+    if skipped_chars:
+        total_tokens += round(skipped_chars * total_tokens / encoded_chars)
+
+    return total_tokens
+
+
+def _count_tokens(encoding: tiktoken.Encoding, texts: list[str]) -> int:
+    """Return the total number of tokens in ``texts``, reusing the counts of previously encoded identical texts.
+
+    Hashing is much cheaper than BPE encoding, so texts of at least ``_TOKEN_COUNT_CACHE_MIN_CHARS`` characters are
+    looked up by their BLAKE2b digest in a small LRU cache first. The remaining texts are encoded in parallel on the
+    shared ``_token_count_executor`` when more than one CPU is available.
+
+    Parameters
+    ----------
+    encoding : tiktoken.Encoding
+        The encoding used to tokenize the texts.
+    texts : list[str]
+        The texts to count tokens in.
+
+    Returns
+    -------
+    int
+        The total number of tokens in ``texts``.
+
+    """
+    total_tokens = 0
+    pending: list[str] = []
+    pending_keys: list[bytes | None] = []
+
+    for text in texts:
+        key = None
+        if len(text) >= _TOKEN_COUNT_CACHE_MIN_CHARS:
+            key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            with _token_count_cache_lock:
+                cached = _token_count_cache.get(key)
+                if cached is not None:
+                    _token_count_cache.move_to_end(key)
+            if cached is not None:
+                total_tokens += cached
+                continue
+        pending.append(text)
+        pending_keys.append(key)
+
+    if _TOKEN_COUNT_THREADS > 1 and len(pending) > 1:
+        counts = [len(tokens) for tokens in _token_count_executor.map(encoding.encode_ordinary, pending)]
+    else:
+        counts = [len(encoding.encode_ordinary(text)) for text in pending]
+
+    with _token_count_cache_lock:
+        for key, count in zip(pending_keys, counts):
+            if key is not None:
+                _token_count_cache[key] = count
+        while len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_count_cache.popitem(last=False)
+
+    return total_tokens + sum(counts)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from gitingest.utils.compat_func import readlink
@@ -93,15 +94,35 @@ class FileSystemNode:  # pylint: disable=too-many-instance-attributes
             A string representation of the node's content.
 
         """
-        parts = [
-            SEPARATOR,
-            f"{self.type.name}: {str(self.path_str).replace(os.sep, '/')}"
-            + (f" -> {readlink(self.path).name}" if self.type == FileSystemNodeType.SYMLINK else ""),
-            SEPARATOR,
-            f"{self.content}",
-        ]
-
-        return "\n".join(parts) + "\n\n"
+        header = f"{self.type.name}: {str(self.path_str).replace(os.sep, '/')}"
+        if self.type == FileSystemNodeType.SYMLINK:
+            header += f" -> {self.symlink_target_name}"
+
+        # A single f-string copies the (possibly large) file content once, instead of once per join/concatenation
+        return f"{SEPARATOR}\n{header}\n{SEPARATOR}\n{self.content}\n\n"
+
+    @cached_property
+    def symlink_target_name(self) -> str:
+        """Return the name of the file or directory the symlink points to.
+
+        The link is only read once per node, since both the directory structure and the file contents show it.
+
+        Returns
+        -------
+        str
+            The name of the symlink's target.
+
+        Raises
+        ------
+        ValueError
+            If the node is not a symlink.
+
+        """
+        if self.type != FileSystemNodeType.SYMLINK:
+            msg = "Cannot read the target of a non-symlink node"
+            raise ValueError(msg)
+
+        return readlink(self.path).name
 
     @property
     def content(self) -> str:  # pylint: disable=too-many-return-statements
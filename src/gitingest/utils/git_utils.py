@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import os
 import re
 import sys
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Generator, Iterable
+from typing import TYPE_CHECKING, ClassVar, Final, Generator, Iterable
 from urllib.parse import urlparse, urlunparse
+from weakref import WeakKeyDictionary
 
 import git
 
@@ -28,6 +31,58 @@ logger = get_logger(__name__)
 #   - github_pat_                       → 22 alphanumerics + "_" + 59 alphanumerics
 _GITHUB_PAT_PATTERN: Final[str] = r"^(?:gh[pousr]_[A-Za-z0-9]{36}|github_pat_[A-Za-z0-9]{22}_[A-Za-z0-9]{59})$"
 
+_GIT_VERSION_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d+)\.(\d+)")
+
+# First Git versions shipping ``clone --filter`` (partial clone) and ``clone --sparse`` / ``sparse-checkout``
+_MIN_FILTER_GIT_VERSION: Final[tuple[int, int]] = (2, 19)
+_MIN_SPARSE_GIT_VERSION: Final[tuple[int, int]] = (2, 25)
+
+
+@dataclass(frozen=True)
+class GitCapabilities:
+    """Version and feature flags of the installed Git, detected once per process.
+
+    Attributes
+    ----------
+    version : tuple[int, int]
+        The ``(major, minor)`` version of the installed Git, or ``(0, 0)`` if it could not be parsed.
+    supports_filter : bool
+        Whether ``git clone`` supports ``--filter`` (partial clone).
+    supports_sparse : bool
+        Whether ``git clone`` supports ``--sparse`` and the ``sparse-checkout`` command.
+
+    """
+
+    version: tuple[int, int]
+    supports_filter: bool
+    supports_sparse: bool
+
+
+class _GitCapabilitiesCache:
+    """Process-wide cache for ``get_git_capabilities``."""
+
+    value: ClassVar[GitCapabilities | None] = None
+    _locks: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]] = WeakKeyDictionary()
+
+    @classmethod
+    def lock(cls) -> asyncio.Lock:
+        """Return the lock guarding the first detection, bound to the running event loop.
+
+        On Python < 3.10, ``asyncio.Lock`` binds to the event loop that is current when it is created, so one lock is
+        created lazily per running loop (e.g. per ``asyncio.run``) instead of once at import time.
+
+        Returns
+        -------
+        asyncio.Lock
+            The lock for the running event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+        return lock
+
 
 def is_github_host(url: str) -> bool:
     """Check if a URL is from a GitHub host (github.com or GitHub Enterprise).
@@ -47,16 +102,17 @@ def is_github_host(url: str) -> bool:
     return hostname.startswith("github.")
 
 
-async def run_command(*args: str) -> tuple[bytes, bytes]:
+async def run_command(*args: str, env: dict[str, str] | None = None) -> tuple[bytes, bytes]:
     """Execute a shell command asynchronously and return (stdout, stderr) bytes.
 
-    This function is kept for backward compatibility with non-git commands.
-    Git operations should use GitPython directly.
+    The command runs directly on the event loop via ``asyncio.create_subprocess_exec``; no executor thread is involved.
 
     Parameters
     ----------
     *args : str
         The command and its arguments to execute.
+    env : dict[str, str] | None
+        Environment for the child process. If ``None``, the current environment is inherited.
 
     Returns
     -------
@@ -74,8 +130,17 @@ async def run_command(*args: str) -> tuple[bytes, bytes]:
         *args,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
+        env=env,
     )
-    stdout, stderr = await proc.communicate()
+    try:
+        stdout, stderr = await proc.communicate()
+    finally:
+        if proc.returncode is None:
+            # On timeout or cancellation, do not leave the child running (e.g. writing into a directory being removed)
+            with suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+
     if proc.returncode != 0:
         msg = f"Command failed: {' '.join(args)}\nError: {stderr.decode().strip()}"
         raise RuntimeError(msg)
@@ -83,10 +148,35 @@ async def run_command(*args: str) -> tuple[bytes, bytes]:
     return stdout, stderr
 
 
-async def ensure_git_installed() -> None:
-    """Ensure Git is installed and accessible on the system.
+async def get_git_capabilities() -> GitCapabilities:
+    """Detect the version and features of the installed Git.
+
+    ``git --version`` is only executed on the first call; concurrent callers wait for that probe and every later call
+    returns the cached result. On Windows, the first call also checks whether Git is configured to support long file
+    paths. If Git is not installed or not accessible, the ``RuntimeError`` from the probe propagates and the next call
+    probes again.
+
+    Returns
+    -------
+    GitCapabilities
+        The version and feature flags of the installed Git.
+
+    """
+    if _GitCapabilitiesCache.value is None:
+        async with _GitCapabilitiesCache.lock():
+            if _GitCapabilitiesCache.value is None:
+                _GitCapabilitiesCache.value = await _detect_git_capabilities()
+
+    return _GitCapabilitiesCache.value
 
-    On Windows, this also checks whether Git is configured to support long file paths.
+
+async def _detect_git_capabilities() -> GitCapabilities:
+    """Run ``git --version`` and derive the capabilities of the installed Git.
+
+    Returns
+    -------
+    GitCapabilities
+        The version and feature flags of the installed Git.
 
     Raises
     ------
@@ -95,30 +185,44 @@ async def ensure_git_installed() -> None:
 
     """
     try:
-        # Use GitPython to check git availability
-        git_cmd = git.Git()
-        git_cmd.version()
-    except git.GitCommandError as exc:
-        msg = "Git is not installed or not accessible. Please install Git first."
-        raise RuntimeError(msg) from exc
-    except Exception as exc:
+        stdout, _ = await run_command("git", "--version")
+    except (OSError, RuntimeError) as exc:
         msg = "Git is not installed or not accessible. Please install Git first."
         raise RuntimeError(msg) from exc
 
+    match = _GIT_VERSION_PATTERN.search(stdout.decode())
+    version = (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
     if sys.platform == "win32":
         try:
-            longpaths_value = git_cmd.config("core.longpaths")
-            if longpaths_value.lower() != "true":
+            longpaths_value, _ = await run_command("git", "config", "core.longpaths")
+            if longpaths_value.decode().strip().lower() != "true":
                 logger.warning(
                     "Git clone may fail on Windows due to long file paths. "
                     "Consider enabling long path support with: 'git config --global core.longpaths true'. "
                     "Note: This command may require administrator privileges.",
                     extra={"platform": "windows", "longpaths_enabled": False},
                 )
-        except git.GitCommandError:
-            # Ignore if checking 'core.longpaths' fails.
+        except RuntimeError:
+            # Ignore if checking 'core.longpaths' fails (e.g. the key is not set).
             pass
 
+    return GitCapabilities(
+        version=version,
+        supports_filter=version >= _MIN_FILTER_GIT_VERSION,
+        supports_sparse=version >= _MIN_SPARSE_GIT_VERSION,
+    )
+
+
+async def ensure_git_installed() -> None:
+    """Ensure Git is installed and accessible on the system.
+
+    On Windows, this also checks whether Git is configured to support long file paths. The check is only performed
+    once per process (see ``get_git_capabilities``).
+
+    """
+    await get_git_capabilities()
+
 
 async def check_repo_exists(url: str, token: str | None = None) -> bool:
     """Check whether a remote Git repository is reachable.
@@ -230,7 +334,7 @@ async def fetch_remote_branches_or_tags(url: str, *, ref_type: str, token: str |
         with git_auth_context(url, token) as (git_cmd, auth_url):
             # Replace the URL in cmd_args with the authenticated URL
             cmd_args[-1] = auth_url  # URL is the last argument
-            output = git_cmd.ls_remote(*cmd_args)
+            output = await asyncio.get_running_loop().run_in_executor(None, git_cmd.ls_remote, *cmd_args)
 
         # Parse output
         return [
@@ -243,46 +347,6 @@ async def fetch_remote_branches_or_tags(url: str, *, ref_type: str, token: str |
         raise RuntimeError(msg) from exc
 
 
-def create_git_repo(local_path: str, url: str, token: str | None = None) -> git.Repo:
-    """Create a GitPython Repo object with authentication if needed.
-
-    Parameters
-    ----------
-    local_path : str
-        The local path where the git repository is located.
-    url : str
-        The repository URL to check if it's a GitHub repository.
-    token : str | None
-        GitHub personal access token (PAT) for accessing private repositories.
-
-    Returns
-    -------
-    git.Repo
-        A GitPython Repo object configured with authentication.
-
-    Raises
-    ------
-    ValueError
-        If the local path is not a valid git repository.
-
-    """
-    try:
-        repo = git.Repo(local_path)
-
-        # Configure authentication if needed
-        if token and is_github_host(url):
-            auth_header = create_git_auth_header(token, url=url)
-            # Set the auth header in git config for this repo
-            key, value = auth_header.split("=", 1)
-            repo.git.config(key, value)
-
-    except git.InvalidGitRepositoryError as exc:
-        msg = f"Invalid git repository at {local_path}"
-        raise ValueError(msg) from exc
-
-    return repo
-
-
 def create_git_auth_header(token: str, url: str = "https://github.com") -> str:
     """Create a Basic authentication header for GitHub git operations.
 
@@ -314,6 +378,33 @@ def create_git_auth_header(token: str, url: str = "https://github.com") -> str:
     return f"http.https://{hostname}/.extraheader=Authorization: Basic {basic}"
 
 
+def create_git_auth_env(url: str, token: str | None = None) -> dict[str, str] | None:
+    """Create the environment for a ``git`` subprocess that needs to authenticate against ``url``.
+
+    The authentication header is passed through ``GIT_CONFIG_PARAMETERS`` rather than on the command line, so the
+    token never shows up in the process list, in error messages, or in the cloned repository's ``.git/config``.
+
+    Parameters
+    ----------
+    url : str
+        The repository URL.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+
+    Returns
+    -------
+    dict[str, str] | None
+        The environment to pass to the subprocess, or ``None`` if no authentication is needed.
+
+    """
+    if not (token and is_github_host(url)):
+        return None
+
+    env = os.environ.copy()
+    env["GIT_CONFIG_PARAMETERS"] = f"'{create_git_auth_header(token, url=url)}'"
+    return env
+
+
 def create_authenticated_url(url: str, token: str | None = None) -> str:
     """Create an authenticated URL for Git operations.
 
@@ -417,10 +508,10 @@ async def checkout_partial_clone(config: CloneConfig, token: str | None) -> None
         # Remove the file name from the subpath when ingesting from a file url (e.g. blob/branch/path/file.txt)
         subpath = str(Path(subpath).parent.as_posix())
 
+    env = create_git_auth_env(config.url, token)
     try:
-        repo = create_git_repo(config.local_path, config.url, token)
-        repo.git.sparse_checkout("set", subpath)
-    except git.GitCommandError as exc:
+        await run_command("git", "-C", config.local_path, "sparse-checkout", "set", subpath, env=env)
+    except RuntimeError as exc:
         msg = f"Failed to configure sparse-checkout: {exc}"
         raise RuntimeError(msg) from exc
 
@@ -481,7 +572,7 @@ async def _resolve_ref_to_sha(url: str, pattern: str, token: str | None = None)
     try:
         # Execute ls-remote command with proper authentication
         with git_auth_context(url, token) as (git_cmd, auth_url):
-            output = git_cmd.ls_remote(auth_url, pattern)
+            output = await asyncio.get_running_loop().run_in_executor(None, git_cmd.ls_remote, auth_url, pattern)
         lines = output.splitlines()
 
         sha = _pick_commit_sha(lines)
@@ -148,7 +148,6 @@ def configure_logging() -> None:
             enqueue=True,  # Async logging for better performance
             diagnose=False,  # Don't include variable values in exceptions (security)
             backtrace=True,  # Include full traceback
-            serialize=True,  # Ensure proper serialization
         )
     else:
         # Human-readable format for development
@@ -37,8 +37,8 @@ def process_patterns(
     # Process include patterns and override ignore patterns accordingly
     if include_patterns:
         parsed_include = _parse_patterns(include_patterns)
-        # Override ignore patterns with include patterns
-        ignore_patterns_set = set(ignore_patterns_set) - set(parsed_include)
+        # Override ignore patterns with include patterns (in place, the set is already a private copy)
+        ignore_patterns_set -= parsed_include
     else:
         parsed_include = None
 
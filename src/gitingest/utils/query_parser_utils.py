@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import string
+import asyncio
+import re
 from typing import TYPE_CHECKING, cast
 from urllib.parse import ParseResult, unquote, urlparse
 
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 # Initialize logger for this module
 logger = get_logger(__name__)
 
-HEX_DIGITS: set[str] = set(string.hexdigits)
+_COMMIT_HASH_PATTERN = re.compile(r"[0-9a-fA-F]{40}")  # Full 40-character hexadecimal SHA-1
 
 KNOWN_GIT_HOSTS: list[str] = [
     "github.com",
@@ -101,6 +102,9 @@ async def _normalise_source(raw: str, token: str | None) -> ParseResult:
 async def _try_domains_for_user_and_repo(user_name: str, repo_name: str, token: str | None = None) -> str:
     """Attempt to find a valid repository host for the given ``user_name`` and ``repo_name``.
 
+    All known hosts are probed concurrently. As soon as every host before it has been ruled out, the first host in
+    ``KNOWN_GIT_HOSTS`` order that has the repository is returned and the remaining probes are cancelled.
+
     Parameters
     ----------
     user_name : str
@@ -121,10 +125,27 @@ async def _try_domains_for_user_and_repo(user_name: str, repo_name: str, token:
         If no valid repository host is found for the given ``user_name`` and ``repo_name``.
 
     """
-    for domain in KNOWN_GIT_HOSTS:
-        candidate = f"https://{domain}/{user_name}/{repo_name}"
-        if await check_repo_exists(candidate, token=token if domain.startswith("github.") else None):
-            return domain
+    checks = [
+        asyncio.create_task(
+            check_repo_exists(
+                f"https://{domain}/{user_name}/{repo_name}",
+                token=token if domain.startswith("github.") else None,
+            ),
+        )
+        for domain in KNOWN_GIT_HOSTS
+    ]
+    try:
+        pending = set(checks)
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for domain, check in zip(KNOWN_GIT_HOSTS, checks):
+                if not check.done():
+                    break  # A higher-priority host is still being probed
+                if check.result():
+                    return domain
+    finally:
+        for check in checks:
+            check.cancel()
 
     msg = f"Could not find a valid repository host for '{user_name}/{repo_name}'."
     raise ValueError(msg)
@@ -147,8 +168,7 @@ def _is_valid_git_commit_hash(commit: str) -> bool:
         ``True`` if the string is a valid 40-character Git commit hash, otherwise ``False``.
 
     """
-    sha_hex_length = 40
-    return len(commit) == sha_hex_length and all(c in HEX_DIGITS for c in commit)
+    return _COMMIT_HASH_PATTERN.fullmatch(commit) is not None
 
 
 def _validate_host(host: str) -> None:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -22,11 +24,14 @@ from server.s3_utils import (
     upload_metadata_to_s3,
     upload_to_s3,
 )
-from server.server_config import MAX_DISPLAY_SIZE
+from server.server_config import INGEST_POOL_SIZE, MAX_DISPLAY_SIZE
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Dedicated pool so concurrent ingestions don't compete for the loop's default executor
+_INGEST_POOL = ThreadPoolExecutor(max_workers=INGEST_POOL_SIZE, thread_name_prefix="ingest")
+
 if TYPE_CHECKING:
     from gitingest.schemas.cloning import CloneConfig
     from gitingest.schemas.ingestion import IngestionQuery
@@ -139,21 +144,21 @@ async def _check_s3_cache(
 def _store_digest_content(
     query: IngestionQuery,
     clone_config: CloneConfig,
-    digest_content: str,
     summary: str,
     tree: str,
     content: str,
 ) -> None:
     """Store digest content either to S3 or locally based on configuration.
 
+    The digest is the directory structure followed by the file contents. It is only assembled into a single string
+    for S3 uploads; local files are written piece by piece to avoid copying the whole digest.
+
     Parameters
     ----------
     query : IngestionQuery
         The query object containing repository information.
     clone_config : CloneConfig
         The clone configuration object.
-    digest_content : str
-        The complete digest content to store.
     summary : str
         The summary content for metadata.
     tree : str
@@ -173,6 +178,7 @@ def _store_digest_content(
             include_patterns=query.include_patterns,
             ignore_patterns=query.ignore_patterns,
         )
+        digest_content = tree + "\n" + content
         s3_url = upload_to_s3(content=digest_content, s3_file_path=s3_file_path, ingest_id=query.id)
 
         # Also upload metadata JSON for caching
@@ -194,7 +200,32 @@ def _store_digest_content(
         # Store locally
         local_txt_file = Path(clone_config.local_path).with_suffix(".txt")
         with local_txt_file.open("w", encoding="utf-8") as f:
-            f.write(digest_content)
+            f.write(tree)
+            f.write("\n")
+            f.write(content)
+
+
+def _ingest_and_store(query: IngestionQuery, clone_config: CloneConfig) -> tuple[str, str, str]:
+    """Run the ingestion and store the resulting digest.
+
+    This is blocking work (filesystem traversal, tokenization, upload) and is meant to run on ``_INGEST_POOL``.
+
+    Parameters
+    ----------
+    query : IngestionQuery
+        The query object containing repository information.
+    clone_config : CloneConfig
+        The clone configuration object.
+
+    Returns
+    -------
+    tuple[str, str, str]
+        A tuple containing the summary, directory structure, and file contents.
+
+    """
+    summary, tree, content = ingest_query(query)
+    _store_digest_content(query, clone_config, summary, tree, content)
+    return summary, tree, content
 
 
 def _generate_digest_url(query: IngestionQuery) -> str:
@@ -301,9 +332,8 @@ async def process_query(
         raise RuntimeError(msg)
 
     try:
-        summary, tree, content = ingest_query(query)
-        digest_content = tree + "\n" + content
-        _store_digest_content(query, clone_config, digest_content, summary, tree, content)
+        loop = asyncio.get_running_loop()
+        summary, tree, content = await loop.run_in_executor(_INGEST_POOL, _ingest_and_store, query, clone_config)
     except Exception as exc:
         _print_error(query.url, exc, max_file_size, pattern_type, pattern)
         # Clean up repository even if processing failed
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 MAX_DISPLAY_SIZE: int = 300_000
 
@@ -13,6 +15,9 @@ MAX_DISPLAY_SIZE: int = 300_000
 DEFAULT_FILE_SIZE_KB: int = 5 * 1024  # 5 mb
 MAX_FILE_SIZE_KB: int = 100 * 1024  # 100 mb
 
+# Worker threads used to run blocking ingestion work off the event loop
+INGEST_POOL_SIZE: int = int(os.getenv("GITINGEST_INGEST_POOL_SIZE", "16"))
+
 EXAMPLE_REPOS: list[dict[str, str]] = [
     {"name": "Gitingest", "url": "https://github.com/coderamp-labs/gitingest"},
     {"name": "FastAPI", "url": "https://github.com/fastapi/fastapi"},
@@ -28,9 +33,13 @@ APP_VERSION = os.getenv("APP_VERSION", "unknown")
 APP_VERSION_URL = os.getenv("APP_VERSION_URL", "https://github.com/coderamp-labs/gitingest")
 
 
+@lru_cache(maxsize=None)
 def get_version_info() -> dict[str, str]:
     """Get version information including display version and link.
 
+    The values only depend on environment variables read at import time, so the result is computed once.
+    Callers must not mutate the returned dictionary.
+
     Returns
     -------
     dict[str, str]
@@ -54,3 +63,7 @@ def get_version_info() -> dict[str, str]:
 # Use absolute path to templates directory
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=templates_dir)
+# Only check templates for changes on every render when hot reloading; otherwise they are compiled once and cached
+templates.env.auto_reload = os.getenv("RELOAD", "false").lower() == "true"
+# Share compiled templates between worker processes and restarts (stored in a per-user temporary directory)
+templates.env.bytecode_cache = FileSystemBytecodeCache()
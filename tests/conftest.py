@@ -7,7 +7,6 @@ to write ``.ipynb`` notebooks for testing notebook utilities.
 from __future__ import annotations
 
 import json
-import sys
 import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict
@@ -16,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from gitingest.query_parser import IngestionQuery
+from gitingest.utils.git_utils import _GitCapabilitiesCache
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -27,25 +27,6 @@ LOCAL_REPO_PATH = "/tmp/repo"
 DEMO_COMMIT = "deadbeefdeadbeefdeadbeefdeadbeefdeadbeef"
 
 
-def get_ensure_git_installed_call_count() -> int:
-    """Get the number of calls made by ensure_git_installed based on platform.
-
-    On Windows, ensure_git_installed makes 2 calls:
-    1. git --version
-    2. git config core.longpaths
-
-    On other platforms, it makes 1 call:
-    1. git --version
-
-    Returns
-    -------
-    int
-        The number of calls made by ensure_git_installed
-
-    """
-    return 2 if sys.platform == "win32" else 1
-
-
 @pytest.fixture
 def sample_query() -> IngestionQuery:
     """Provide a default ``IngestionQuery`` object for use in tests.
@@ -209,13 +190,15 @@ def repo_exists_true(mocker: MockerFixture) -> AsyncMock:
 
 @pytest.fixture
 def run_command_mock(mocker: MockerFixture) -> AsyncMock:
-    """Patch ``gitingest.clone.run_command`` with an ``AsyncMock``.
+    """Patch ``run_command`` in ``gitingest.clone`` and ``gitingest.utils.git_utils`` with an ``AsyncMock``.
 
     The mocked function returns a dummy process whose ``communicate`` method yields generic
     ``stdout`` / ``stderr`` bytes. Tests can still access / tweak the mock via the fixture argument.
     """
     mock = AsyncMock(side_effect=_fake_run_command)
     mocker.patch("gitingest.utils.git_utils.run_command", mock)
+    mocker.patch("gitingest.clone.run_command", mock)
+    mocker.patch.object(_GitCapabilitiesCache, "value", None)
 
     # Mock GitPython components
     _setup_gitpython_mocks(mocker)
@@ -259,9 +242,6 @@ def _setup_gitpython_mocks(mocker: MockerFixture) -> dict[str, MagicMock]:
     # Patch imports in our modules
     mocker.patch("gitingest.utils.git_utils.git.Git", return_value=mock_git_cmd)
     mocker.patch("gitingest.utils.git_utils.git.Repo", return_value=mock_repo)
-    mocker.patch("gitingest.clone.git.Git", return_value=mock_git_cmd)
-    mocker.patch("gitingest.clone.git.Repo", return_value=mock_repo)
-    mocker.patch("gitingest.clone.git.Repo.clone_from", mock_clone_from)
 
     return {
         "git_cmd": mock_git_cmd,
@@ -272,8 +252,10 @@ def _setup_gitpython_mocks(mocker: MockerFixture) -> dict[str, MagicMock]:
     }
 
 
-async def _fake_run_command(*args: str) -> tuple[bytes, bytes]:
+async def _fake_run_command(*args: str, **_kwargs: object) -> tuple[bytes, bytes]:
     if "ls-remote" in args:
         # single match: <sha> <tab>refs/heads/main
         return (f"{DEMO_COMMIT}\trefs/heads/main\n".encode(), b"")
+    if "--version" in args:
+        return (b"git version 2.34.1\n", b"")
     return (b"output", b"error")
@@ -6,11 +6,21 @@ Bitbucket, Gitea, and Codeberg, even if the host is omitted.
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 import pytest
 
 from gitingest.config import MAX_FILE_SIZE
 from gitingest.query_parser import parse_remote_repo
-from gitingest.utils.query_parser_utils import KNOWN_GIT_HOSTS, _is_valid_git_commit_hash
+from gitingest.utils.query_parser_utils import (
+    KNOWN_GIT_HOSTS,
+    _is_valid_git_commit_hash,
+    _try_domains_for_user_and_repo,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 # Repository matrix: (host, user, repo)
 _REPOS: list[tuple[str, str, str]] = [
@@ -77,3 +87,40 @@ async def test_parse_query_without_host(
     }
 
     assert actual == expected
+
+
+@pytest.mark.asyncio
+async def test_try_domains_prefers_first_known_host(mocker: MockerFixture) -> None:
+    """Test that all hosts are probed and the first matching host in ``KNOWN_GIT_HOSTS`` order is returned."""
+    found = {"https://gitea.com/user/repo", "https://gitlab.com/user/repo"}
+    check = mocker.patch(
+        "gitingest.utils.query_parser_utils.check_repo_exists",
+        side_effect=lambda url, **_: url in found,
+    )
+
+    assert await _try_domains_for_user_and_repo("user", "repo") == "gitlab.com"
+    assert check.call_count == len(KNOWN_GIT_HOSTS)
+
+
+@pytest.mark.asyncio
+async def test_try_domains_returns_without_waiting_for_lower_priority_hosts(mocker: MockerFixture) -> None:
+    """Test that a match on the first host is returned without waiting for the slower, lower-priority hosts."""
+    cancelled: list[str] = []
+
+    async def _check(url: str, **_: object) -> bool:
+        if url.startswith(f"https://{KNOWN_GIT_HOSTS[0]}/"):
+            return True
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return True
+
+    mocker.patch("gitingest.utils.query_parser_utils.check_repo_exists", side_effect=_check)
+
+    domain = await asyncio.wait_for(_try_domains_for_user_and_repo("user", "repo"), timeout=5)
+
+    assert domain == KNOWN_GIT_HOSTS[0]
+    await asyncio.sleep(0)  # Let the cancelled probes run their cleanup
+    assert len(cancelled) == len(KNOWN_GIT_HOSTS) - 1
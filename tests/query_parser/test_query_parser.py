@@ -326,6 +326,22 @@ async def test_parse_repo_source_with_various_url_patterns(
     assert query.subpath == expected_subpath
 
 
+@pytest.mark.parametrize(
+    ("commit", "expected"),
+    [
+        ("a" * 40, True),
+        ("0123456789abcdefABCDEF0123456789abcdefAB", True),
+        ("a" * 39, False),
+        ("a" * 41, False),
+        ("a" * 40 + "\n", False),
+        ("g" * 40, False),
+    ],
+)
+def test_is_valid_git_commit_hash(commit: str, *, expected: bool) -> None:
+    """Test that only full 40-character hexadecimal strings are treated as commit hashes."""
+    assert _is_valid_git_commit_hash(commit) is expected
+
+
 @pytest.mark.asyncio
 async def _assert_basic_repo_fields(url: str, sha_mock: AsyncMock) -> IngestionQuery:
     """Run ``parse_remote_repo`` and assert user, repo and slug are parsed."""
@@ -6,15 +6,14 @@ and handling edge cases such as nonexistent URLs, timeouts, redirects, and speci
 
 from __future__ import annotations
 
-import sys
 from typing import TYPE_CHECKING
 
 import pytest
 
 from gitingest.clone import clone_repo
 from gitingest.schemas import CloneConfig
-from gitingest.utils.git_utils import check_repo_exists
-from tests.conftest import DEMO_URL, LOCAL_REPO_PATH
+from gitingest.utils.git_utils import GitCapabilities, _GitCapabilitiesCache, check_repo_exists
+from tests.conftest import DEMO_COMMIT, DEMO_URL, LOCAL_REPO_PATH
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -27,11 +26,21 @@ if TYPE_CHECKING:
 # Apply the check-repo patch automatically so individual tests don't need to repeat it.
 pytestmark = pytest.mark.usefixtures("repo_exists_true")
 
-GIT_INSTALLED_CALLS = 2 if sys.platform == "win32" else 1
+
+# One-off probes made while detecting Git capabilities (``core.longpaths`` is only checked on Windows)
+_GIT_PROBE_CALLS = {("git", "--version"), ("git", "config", "core.longpaths")}
+
+
+def _git_calls(run_command_mock: AsyncMock) -> list[tuple[str, ...]]:
+    """Return the positional arguments of every ``git`` invocation made through ``run_command``.
+
+    The one-off capability probes (``git --version`` and, on Windows, ``git config core.longpaths``) are left out.
+    """
+    return [call.args for call in run_command_mock.call_args_list if call.args not in _GIT_PROBE_CALLS]
 
 
 @pytest.mark.asyncio
-async def test_clone_with_commit(repo_exists_true: AsyncMock, gitpython_mocks: dict) -> None:
+async def test_clone_with_commit(repo_exists_true: AsyncMock, run_command_mock: AsyncMock) -> None:
     """Test cloning a repository with a specific commit hash.
 
     Given a valid URL and a commit hash:
@@ -50,20 +59,33 @@ async def test_clone_with_commit(repo_exists_true: AsyncMock, gitpython_mocks: d
 
     repo_exists_true.assert_any_call(clone_config.url, token=None)
 
-    # Verify GitPython calls were made
-    mock_git_cmd = gitpython_mocks["git_cmd"]
-    mock_repo = gitpython_mocks["repo"]
-    mock_clone_from = gitpython_mocks["clone_from"]
+    assert _git_calls(run_command_mock) == [
+        ("git", "clone", "--single-branch", "--depth=1", "--no-checkout", DEMO_URL, LOCAL_REPO_PATH),
+        ("git", "-C", LOCAL_REPO_PATH, "fetch", "--depth=1", "origin", commit_hash),
+        ("git", "-C", LOCAL_REPO_PATH, "checkout", commit_hash),
+    ]
 
-    # Should have called version (for ensure_git_installed)
-    mock_git_cmd.version.assert_called()
 
-    # Should have called clone_from (since partial_clone=False)
-    mock_clone_from.assert_called_once()
+@pytest.mark.asyncio
+async def test_clone_at_revision(run_command_mock: AsyncMock, mocker: MockerFixture) -> None:
+    """Test that recent Git versions clone straight at the commit.
+
+    Given a commit hash and Git 2.49:
+    When ``clone_repo`` is called,
+    Then a single ``git clone --revision`` should replace the separate fetch and checkout.
+    """
+    mocker.patch.object(
+        _GitCapabilitiesCache,
+        "value",
+        GitCapabilities(version=(2, 49), supports_filter=True, supports_sparse=True),
+    )
+    clone_config = CloneConfig(url=DEMO_URL, local_path=LOCAL_REPO_PATH, commit=DEMO_COMMIT)
+
+    await clone_repo(clone_config)
 
-    # Should have called fetch and checkout on the repo
-    mock_repo.git.fetch.assert_called()
-    mock_repo.git.checkout.assert_called_with(commit_hash)
+    assert _git_calls(run_command_mock) == [
+        ("git", "clone", "--single-branch", "--depth=1", f"--revision={DEMO_COMMIT}", DEMO_URL, LOCAL_REPO_PATH),
+    ]
 
 
 @pytest.mark.asyncio
@@ -118,7 +140,11 @@ async def test_check_repo_exists(
 
 
 @pytest.mark.asyncio
-async def test_clone_without_commit(repo_exists_true: AsyncMock, gitpython_mocks: dict) -> None:
+async def test_clone_without_commit(
+    repo_exists_true: AsyncMock,
+    run_command_mock: AsyncMock,
+    gitpython_mocks: dict,
+) -> None:
     """Test cloning a repository when no commit hash is provided.
 
     Given a valid URL and no commit hash:
@@ -131,22 +157,17 @@ async def test_clone_without_commit(repo_exists_true: AsyncMock, gitpython_mocks
 
     repo_exists_true.assert_any_call(clone_config.url, token=None)
 
-    # Verify GitPython calls were made
-    mock_git_cmd = gitpython_mocks["git_cmd"]
-    mock_repo = gitpython_mocks["repo"]
-    mock_clone_from = gitpython_mocks["clone_from"]
-
     # Should have resolved the commit via ls_remote
-    mock_git_cmd.ls_remote.assert_called()
-    # Should have cloned the repo
-    mock_clone_from.assert_called_once()
-    # Should have fetched and checked out
-    mock_repo.git.fetch.assert_called()
-    mock_repo.git.checkout.assert_called()
+    gitpython_mocks["git_cmd"].ls_remote.assert_called()
+
+    calls = _git_calls(run_command_mock)
+    assert calls[0][:2] == ("git", "clone")
+    assert ("git", "-C", LOCAL_REPO_PATH, "fetch", "--depth=1", "origin", DEMO_COMMIT) in calls
+    assert calls[-1] == ("git", "-C", LOCAL_REPO_PATH, "checkout", DEMO_COMMIT)
 
 
 @pytest.mark.asyncio
-async def test_clone_creates_parent_directory(tmp_path: Path, gitpython_mocks: dict) -> None:
+async def test_clone_creates_parent_directory(tmp_path: Path, run_command_mock: AsyncMock) -> None:
     """Test that ``clone_repo`` creates parent directories if they don't exist.
 
     Given a local path with non-existent parent directories:
@@ -162,47 +183,105 @@ async def test_clone_creates_parent_directory(tmp_path: Path, gitpython_mocks: d
     assert nested_path.parent.exists()
 
     # Verify clone operation happened
-    mock_clone_from = gitpython_mocks["clone_from"]
-    mock_clone_from.assert_called_once()
+    assert _git_calls(run_command_mock)[0][-2:] == (DEMO_URL, str(nested_path))
 
 
 @pytest.mark.asyncio
-async def test_clone_with_specific_subpath(gitpython_mocks: dict) -> None:
+@pytest.mark.parametrize(
+    ("subpath", "expected_filter"),
+    [
+        ("docs", "--filter=blob:none"),  # shallow subpath
+        ("src/docs", "--filter=tree:0"),  # deep subpath
+    ],
+)
+async def test_clone_with_specific_subpath(subpath: str, expected_filter: str, run_command_mock: AsyncMock) -> None:
     """Test cloning a repository with a specific subpath.
 
     Given a valid repository URL and a specific subpath:
     When ``clone_repo`` is called,
-    Then the repository should be cloned with sparse checkout enabled.
+    Then the repository should be cloned with sparse checkout enabled and a filter matching the subpath depth.
     """
-    subpath = "src/docs"
     clone_config = CloneConfig(url=DEMO_URL, local_path=LOCAL_REPO_PATH, subpath=subpath)
 
     await clone_repo(clone_config)
 
-    # Verify partial clone (using git.clone instead of Repo.clone_from)
-    mock_git_cmd = gitpython_mocks["git_cmd"]
-    mock_git_cmd.clone.assert_called()
+    calls = _git_calls(run_command_mock)
+    clone_call = next(call for call in calls if call[:2] == ("git", "clone"))
+
+    # Verify partial clone
+    assert "--sparse" in clone_call
+    assert expected_filter in clone_call
 
     # Verify sparse checkout was configured
-    mock_repo = gitpython_mocks["repo"]
-    mock_repo.git.sparse_checkout.assert_called()
+    assert ("git", "-C", LOCAL_REPO_PATH, "sparse-checkout", "set", subpath) in calls
 
 
 @pytest.mark.asyncio
-async def test_clone_with_include_submodules(gitpython_mocks: dict) -> None:
+async def test_clone_subpath_without_sparse_support(run_command_mock: AsyncMock, mocker: MockerFixture) -> None:
+    """Test that a subpath is cloned in full when Git does not support sparse checkouts.
+
+    Given a subpath and Git 2.20:
+    When ``clone_repo`` is called,
+    Then the repository should be cloned without ``--sparse`` and no sparse checkout should be configured.
+    """
+    mocker.patch.object(
+        _GitCapabilitiesCache,
+        "value",
+        GitCapabilities(version=(2, 20), supports_filter=True, supports_sparse=False),
+    )
+    clone_config = CloneConfig(url=DEMO_URL, local_path=LOCAL_REPO_PATH, subpath="src/docs")
+
+    await clone_repo(clone_config)
+
+    calls = _git_calls(run_command_mock)
+    assert "--sparse" not in calls[0]
+    assert not any("sparse-checkout" in call for call in calls)
+
+
+@pytest.mark.asyncio
+async def test_clone_with_include_submodules(run_command_mock: AsyncMock, mocker: MockerFixture) -> None:
     """Test cloning a repository with submodules included.
 
     Given a valid URL and ``include_submodules=True``:
     When ``clone_repo`` is called,
-    Then the repository should update submodules after cloning.
+    Then the repository should update submodules in parallel after cloning.
     """
+    mocker.patch("gitingest.clone.os.cpu_count", return_value=8)
     clone_config = CloneConfig(url=DEMO_URL, local_path=LOCAL_REPO_PATH, branch="main", include_submodules=True)
 
     await clone_repo(clone_config)
 
-    # Verify submodule update was called
-    mock_repo = gitpython_mocks["repo"]
-    mock_repo.git.submodule.assert_called_with("update", "--init", "--recursive", "--depth=1")
+    assert _git_calls(run_command_mock)[-1] == (
+        "git",
+        "-C",
+        LOCAL_REPO_PATH,
+        "submodule",
+        "update",
+        "--init",
+        "--recursive",
+        "--jobs=8",
+        "--depth=1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_clone_passes_token_through_environment(run_command_mock: AsyncMock) -> None:
+    """Test that the authentication header is passed through the environment, not the command line.
+
+    Given a GitHub URL and a token:
+    When ``clone_repo`` is called,
+    Then every ``git`` invocation should receive ``GIT_CONFIG_PARAMETERS`` and no argument should contain the token.
+    """
+    token = "ghp_" + "a" * 36
+    clone_config = CloneConfig(url=DEMO_URL, local_path=LOCAL_REPO_PATH, commit=DEMO_COMMIT)
+
+    await clone_repo(clone_config, token=token)
+
+    for call in run_command_mock.call_args_list:
+        if call.args in _GIT_PROBE_CALLS:
+            continue
+        assert "GIT_CONFIG_PARAMETERS" in call.kwargs["env"]
+        assert not any(token in arg for arg in call.args)
 
 
 @pytest.mark.asyncio
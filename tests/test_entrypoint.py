@@ -0,0 +1,100 @@
+"""Tests for writing the digest to an output file in ``gitingest.entrypoint``."""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+import pytest
+
+from gitingest.entrypoint import ingest
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from gitingest.schemas import IngestionQuery
+
+
+@pytest.fixture(name="repo_path")
+def repo_fixture(tmp_path: Path) -> Path:
+    """Create a small directory to ingest."""
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    (repo_path / "file.txt").write_text("Hello World")
+    return repo_path
+
+
+@pytest.mark.parametrize("stream_output", [False, True])
+def test_ingest_writes_output_file(tmp_path: Path, repo_path: Path, *, stream_output: bool) -> None:
+    """Test that the digest written to ``output`` is the same whether or not it is streamed."""
+    output_path = tmp_path / "digest.txt"
+
+    _, tree, content = ingest(str(repo_path), output=str(output_path), stream_output=stream_output)
+
+    digest = output_path.read_text(encoding="utf-8")
+    assert digest.startswith(f"{tree}\n")
+    assert "Hello World" in digest
+    assert bool(content) is not stream_output
+    # The temporary file the digest was written to has been moved into place
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["digest.txt", "repo"]
+
+
+def test_failed_ingest_keeps_previous_output(tmp_path: Path, repo_path: Path, mocker: MockerFixture) -> None:
+    """Test that a failed streamed ingestion leaves the previous output file untouched."""
+    output_path = tmp_path / "digest.txt"
+    output_path.write_text("previous digest", encoding="utf-8")
+
+    def _fail_midway(_query: IngestionQuery, *, output_stream: TextIO) -> None:
+        output_stream.write("partial digest")
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    mocker.patch("gitingest.entrypoint.ingest_query", side_effect=_fail_midway)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        ingest(str(repo_path), output=str(output_path), stream_output=True)
+
+    assert output_path.read_text(encoding="utf-8") == "previous digest"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["digest.txt", "repo"]
+
+
+def test_ingest_keeps_output_file_mode(tmp_path: Path, repo_path: Path) -> None:
+    """Test that replacing an existing output file keeps its permissions."""
+    output_path = tmp_path / "digest.txt"
+    output_path.write_text("previous digest", encoding="utf-8")
+    mode = 0o640
+    output_path.chmod(mode)
+
+    ingest(str(repo_path), output=str(output_path), stream_output=True)
+
+    assert "Hello World" in output_path.read_text(encoding="utf-8")
+    assert stat.S_IMODE(output_path.stat().st_mode) == mode
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="FIFOs are not available on Windows")
+def test_ingest_writes_to_fifo(tmp_path: Path, repo_path: Path) -> None:
+    """Test that a FIFO output target is written to directly instead of being replaced by a regular file."""
+    fifo_path = tmp_path / "digest.fifo"
+    os.mkfifo(fifo_path)
+    received: list[str] = []
+    reader = threading.Thread(target=lambda: received.append(fifo_path.read_text(encoding="utf-8")), daemon=True)
+    reader.start()
+
+    ingest(str(repo_path), output=str(fifo_path), stream_output=True)
+    reader.join(timeout=10)
+
+    assert stat.S_ISFIFO(fifo_path.stat().st_mode)
+    assert received
+    assert "Hello World" in received[0]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Character devices are POSIX-only")
+def test_ingest_writes_to_dev_null(repo_path: Path) -> None:
+    """Test that ``/dev/null`` stays a character device when used as the output target."""
+    ingest(str(repo_path), output=os.devnull, stream_output=True)
+
+    assert Path(os.devnull).is_char_device()
@@ -6,16 +6,25 @@ GitHub personal access tokens (PATs) are properly formatted.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import sys
 from typing import TYPE_CHECKING
 
 import pytest
 
 from gitingest.utils.exceptions import InvalidGitHubTokenError
-from gitingest.utils.git_utils import create_git_auth_header, create_git_repo, is_github_host, validate_github_token
+from gitingest.utils.git_utils import (
+    create_git_auth_env,
+    create_git_auth_header,
+    get_git_capabilities,
+    is_github_host,
+    run_command,
+    validate_github_token,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from unittest.mock import AsyncMock
 
     from pytest_mock import MockerFixture
 
@@ -55,54 +64,6 @@ def test_validate_github_token_invalid(token: str) -> None:
         validate_github_token(token)
 
 
-@pytest.mark.parametrize(
-    ("local_path", "url", "token", "should_configure_auth"),
-    [
-        (
-            "/some/path",
-            "https://github.com/owner/repo.git",
-            None,
-            False,  # No auth configuration expected when token is None
-        ),
-        (
-            "/some/path",
-            "https://github.com/owner/repo.git",
-            "ghp_" + "d" * 36,
-            True,  # Auth configuration expected for GitHub URL + token
-        ),
-        (
-            "/some/path",
-            "https://gitlab.com/owner/repo.git",
-            "ghp_" + "e" * 36,
-            False,  # No auth configuration for non-GitHub URL even if token provided
-        ),
-    ],
-)
-def test_create_git_repo(
-    local_path: str,
-    url: str,
-    token: str | None,
-    should_configure_auth: bool,  # noqa: FBT001
-    mocker: MockerFixture,
-) -> None:
-    """Test that ``create_git_repo`` creates a proper Git repo object."""
-    # Mock git.Repo to avoid actual filesystem operations
-    mock_repo = mocker.MagicMock()
-    mock_repo_class = mocker.patch("git.Repo", return_value=mock_repo)
-
-    repo = create_git_repo(local_path, url, token)
-
-    # Should create repo with correct path
-    mock_repo_class.assert_called_once_with(local_path)
-    assert repo == mock_repo
-
-    # Check auth configuration
-    if should_configure_auth:
-        mock_repo.git.config.assert_called_once()
-    else:
-        mock_repo.git.config.assert_not_called()
-
-
 @pytest.mark.parametrize(
     "token",
     [
@@ -118,38 +79,6 @@ def test_create_git_auth_header(token: str) -> None:
     assert header == expected
 
 
-@pytest.mark.parametrize(
-    ("url", "token", "should_call"),
-    [
-        ("https://github.com/foo/bar.git", "ghp_" + "f" * 36, True),
-        ("https://github.com/foo/bar.git", None, False),
-        ("https://gitlab.com/foo/bar.git", "ghp_" + "g" * 36, False),
-    ],
-)
-def test_create_git_repo_helper_calls(
-    mocker: MockerFixture,
-    tmp_path: Path,
-    *,
-    url: str,
-    token: str | None,
-    should_call: bool,
-) -> None:
-    """Test that ``create_git_auth_header`` is invoked only when appropriate."""
-    work_dir = tmp_path / "repo"
-    header_mock = mocker.patch("gitingest.utils.git_utils.create_git_auth_header", return_value="key=value")
-    mock_repo = mocker.MagicMock()
-    mocker.patch("git.Repo", return_value=mock_repo)
-
-    create_git_repo(str(work_dir), url, token)
-
-    if should_call:
-        header_mock.assert_called_once_with(token, url=url)
-        mock_repo.git.config.assert_called_once_with("key", "value")
-    else:
-        header_mock.assert_not_called()
-        mock_repo.git.config.assert_not_called()
-
-
 @pytest.mark.parametrize(
     ("url", "expected"),
     [
@@ -201,77 +130,57 @@ def test_create_git_auth_header_with_ghe_url(token: str, url: str, expected_host
 
 
 @pytest.mark.parametrize(
-    ("local_path", "url", "token", "expected_auth_hostname"),
+    ("url", "expected_hostname"),
     [
-        # GitHub.com URLs - should use default hostname
-        (
-            "/some/path",
-            "https://github.com/owner/repo.git",
-            "ghp_" + "a" * 36,
-            "github.com",
-        ),
-        # GitHub Enterprise URLs - should use custom hostname
-        (
-            "/some/path",
-            "https://github.company.com/owner/repo.git",
-            "ghp_" + "b" * 36,
-            "github.company.com",
-        ),
-        (
-            "/some/path",
-            "https://github.enterprise.org/owner/repo.git",
-            "ghp_" + "c" * 36,
-            "github.enterprise.org",
-        ),
-        (
-            "/some/path",
-            "http://github.internal/owner/repo.git",
-            "ghp_" + "d" * 36,
-            "github.internal",
-        ),
+        ("https://github.com/owner/repo", "github.com"),
+        ("https://github.company.com/owner/repo", "github.company.com"),
     ],
 )
-def test_create_git_repo_with_ghe_urls(
-    local_path: str,
-    url: str,
-    token: str,
-    expected_auth_hostname: str,
-    mocker: MockerFixture,
-) -> None:
-    """Test that ``create_git_repo`` handles GitHub Enterprise URLs correctly."""
-    mock_repo = mocker.MagicMock()
-    mocker.patch("git.Repo", return_value=mock_repo)
-
-    create_git_repo(local_path, url, token)
+def test_create_git_auth_env_for_github_hosts(url: str, expected_hostname: str) -> None:
+    """Test that ``create_git_auth_env`` passes the auth header for GitHub and GitHub Enterprise hosts."""
+    token = "ghp_" + "a" * 36
 
-    # Should configure auth with the correct hostname
-    mock_repo.git.config.assert_called_once()
-    auth_config_call = mock_repo.git.config.call_args[0]
+    env = create_git_auth_env(url, token=token)
 
-    # The first argument should contain the hostname
-    assert expected_auth_hostname in auth_config_call[0]
+    assert env is not None
+    expected_basic = base64.b64encode(f"x-oauth-basic:{token}".encode()).decode()
+    expected = f"'http.https://{expected_hostname}/.extraheader=Authorization: Basic {expected_basic}'"
+    assert env["GIT_CONFIG_PARAMETERS"] == expected
 
 
 @pytest.mark.parametrize(
-    ("local_path", "url", "token"),
+    ("url", "token"),
     [
-        # Should NOT configure auth for non-GitHub URLs
-        ("/some/path", "https://gitlab.com/owner/repo.git", "ghp_" + "a" * 36),
-        ("/some/path", "https://bitbucket.org/owner/repo.git", "ghp_" + "b" * 36),
-        ("/some/path", "https://git.example.com/owner/repo.git", "ghp_" + "c" * 36),
+        ("https://gitlab.com/owner/repo", "ghp_" + "a" * 36),  # non-GitHub host
+        ("https://github.com/owner/repo", None),  # no token
     ],
 )
-def test_create_git_repo_ignores_non_github_urls(
-    local_path: str,
-    url: str,
-    token: str,
-    mocker: MockerFixture,
-) -> None:
-    """Test that ``create_git_repo`` does not configure auth for non-GitHub URLs."""
-    mock_repo = mocker.MagicMock()
-    mocker.patch("git.Repo", return_value=mock_repo)
+def test_create_git_auth_env_without_auth(url: str, token: str | None) -> None:
+    """Test that ``create_git_auth_env`` returns ``None`` when no authentication is needed."""
+    assert create_git_auth_env(url, token=token) is None
+
+
+@pytest.mark.asyncio
+async def test_run_command_kills_process_on_timeout(mocker: MockerFixture) -> None:
+    """Test that ``run_command`` does not leave the child process running when it is interrupted."""
+    create_subprocess_exec = mocker.spy(asyncio, "create_subprocess_exec")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(run_command(sys.executable, "-c", "import time; time.sleep(30)"), timeout=0.5)
+
+    proc = create_subprocess_exec.spy_return
+    assert proc.returncode is not None
+
 
-    create_git_repo(local_path, url, token)
+@pytest.mark.asyncio
+async def test_get_git_capabilities_is_cached(run_command_mock: AsyncMock) -> None:
+    """Test that ``get_git_capabilities`` only runs ``git --version`` once and parses the version."""
+    first = await get_git_capabilities()
+    second = await get_git_capabilities()
 
-    # Should not configure auth for non-GitHub URLs
-    mock_repo.git.config.assert_not_called()
+    assert first is second
+    assert first.version == (2, 34)
+    assert first.supports_filter
+    assert first.supports_sparse
+    version_calls = [call for call in run_command_mock.call_args_list if call.args == ("git", "--version")]
+    assert len(version_calls) == 1
@@ -6,16 +6,27 @@ including filtering patterns and subpaths.
 
 from __future__ import annotations
 
+import io
 import re
 from typing import TYPE_CHECKING, TypedDict
 
 import pytest
 
 from gitingest.ingestion import ingest_query
+from gitingest.output_formatter import (
+    _TOKEN_COUNT_CACHE_MIN_CHARS,
+    _content_read_executor,
+    _count_lines,
+    _count_tokens,
+    _estimate_tokens,
+    _token_count_executor,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
     from gitingest.query_parser import IngestionQuery
 
 
@@ -46,6 +57,130 @@ def test_run_ingest_query(temp_directory: Path, sample_query: IngestionQuery) ->
     assert "dir2/file_dir2.txt" in content
 
 
+def test_ingest_query_tree_structure(temp_directory: Path, sample_query: IngestionQuery) -> None:
+    """Test that ``ingest_query`` renders the directory tree in sorted, depth-first order.
+
+    Given a directory with nested subdirectories:
+    When ``ingest_query`` is invoked,
+    Then the tree should list files before directories at every level, with the expected connectors.
+    """
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+
+    _, tree, content = ingest_query(sample_query)
+
+    assert tree == (
+        "Directory structure:\n"
+        "└── test_repo/\n"
+        "    ├── file1.txt\n"
+        "    ├── file2.py\n"
+        "    ├── dir1/\n"
+        "    │   └── file_dir1.txt\n"
+        "    ├── dir2/\n"
+        "    │   └── file_dir2.txt\n"
+        "    └── src/\n"
+        "        ├── subfile1.txt\n"
+        "        ├── subfile2.py\n"
+        "        └── subdir/\n"
+        "            ├── file_subdir.py\n"
+        "            └── file_subdir.txt\n"
+    )
+
+    # File contents follow the same order as the tree
+    positions = [content.index(f"FILE: {name}") for name in ("file1.txt", "dir1/", "dir2/", "src/subfile1.txt")]
+    assert positions == sorted(positions)
+
+
+def test_ingest_query_symlink(temp_directory: Path, sample_query: IngestionQuery) -> None:
+    """Test that ``ingest_query`` shows the target of a symlink in both the tree and the file contents.
+
+    Given a directory containing a symlink:
+    When ``ingest_query`` is invoked,
+    Then the tree line and the content header of the symlink should both name its target.
+    """
+    (temp_directory / "link.txt").symlink_to(temp_directory / "file1.txt")
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+
+    _, tree, content = ingest_query(sample_query)
+
+    assert "    ├── link.txt -> file1.txt\n" in tree
+    assert "SYMLINK: link.txt -> file1.txt\n" in content
+
+
+def test_ingest_query_reads_contents_in_parallel(
+    temp_directory: Path,
+    sample_query: IngestionQuery,
+    mocker: MockerFixture,
+) -> None:
+    """Test that reading file contents on the shared thread pool keeps them in tree order.
+
+    Given a directory with more files than the parallel-read threshold:
+    When ``ingest_query`` is invoked,
+    Then the content should be identical to reading the files one after another.
+    """
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+    _, _, serial_content = ingest_query(sample_query)
+
+    mocker.patch("gitingest.output_formatter._CONTENT_READ_MIN_FILES", 1)
+    mocker.patch("gitingest.output_formatter._CONTENT_READ_WORKERS", 2)
+    submit = mocker.spy(_content_read_executor, "submit")
+    _, _, parallel_content = ingest_query(sample_query)
+
+    assert parallel_content == serial_content
+    assert submit.called
+
+
+def test_ingest_query_streams_to_output(temp_directory: Path, sample_query: IngestionQuery) -> None:
+    """Test that ``ingest_query`` streams the digest when given an output stream.
+
+    Given an output stream:
+    When ``ingest_query`` is invoked,
+    Then the stream should receive the tree followed by the file contents, and the returned content should be empty.
+    """
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+
+    _, expected_tree, expected_content = ingest_query(sample_query)
+
+    output_stream = io.StringIO()
+    _, tree, content = ingest_query(sample_query, output_stream=output_stream)
+
+    assert tree == expected_tree
+    assert content == ""
+    assert output_stream.getvalue() == f"{expected_tree}\n{expected_content}"
+
+
+def test_ingest_query_stream_write_errors_propagate(
+    temp_directory: Path,
+    sample_query: IngestionQuery,
+    mocker: MockerFixture,
+) -> None:
+    """Test that errors writing the streamed digest are raised instead of being swallowed by token counting.
+
+    Given an output stream that cannot encode the digest and a working tokenizer:
+    When ``ingest_query`` is invoked,
+    Then the ``UnicodeEncodeError`` from the write should propagate.
+    """
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_THREADS", 1)
+    encoding = mocker.Mock()
+    encoding.encode_ordinary.side_effect = str.split
+    mocker.patch("tiktoken.get_encoding", return_value=encoding)
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+
+    output_stream = io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+
+    with pytest.raises(UnicodeEncodeError):
+        ingest_query(sample_query, output_stream=output_stream)
+
+
 # TODO: Additional tests:
 # - Multiple include patterns, e.g. ["*.txt", "*.py"] or ["/src/*", "*.txt"].
 # - Edge cases with weird file names or deep subdirectory structures.
@@ -233,3 +368,53 @@ def test_include_ignore_patterns(
     # check non-presence of non-included directories in structure
     for expected_not_structure_item in pattern_scenario["expected_not_structure"]:
         assert expected_not_structure_item not in structure
+
+
+@pytest.mark.parametrize("text", ["", "\n", "one", "one\n", "one\ntwo", "one\r\ntwo\r\n", "one\n\n\ntwo\n"])
+def test_count_lines_matches_splitlines(text: str) -> None:
+    """Test that ``_count_lines`` agrees with ``str.splitlines`` for LF and CRLF line endings."""
+    assert _count_lines(text) == len(text.splitlines())
+
+
+def test_count_tokens_reuses_count_of_identical_large_text(mocker: MockerFixture) -> None:
+    """Test that ``_count_tokens`` only encodes a large text once and serves repeats from its cache."""
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_THREADS", 1)
+    encoding = mocker.Mock()
+    encoding.encode_ordinary.side_effect = str.split
+    text = "token " * _TOKEN_COUNT_CACHE_MIN_CHARS
+
+    assert _count_tokens(encoding, [text]) == _TOKEN_COUNT_CACHE_MIN_CHARS
+    same_text = "".join(["token "] * _TOKEN_COUNT_CACHE_MIN_CHARS)
+    assert _count_tokens(encoding, [same_text]) == _TOKEN_COUNT_CACHE_MIN_CHARS
+    encoding.encode_ordinary.assert_called_once()
+
+    # Short texts are not cached
+    encoding.encode_ordinary.reset_mock()
+    _count_tokens(encoding, ["a b c"])
+    _count_tokens(encoding, ["a b c"])
+    assert encoding.encode_ordinary.call_args_list == [mocker.call("a b c")] * 2
+
+
+def test_count_tokens_encodes_on_shared_executor(mocker: MockerFixture) -> None:
+    """Test that ``_count_tokens`` encodes several texts on the shared executor on multiple CPUs."""
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_THREADS", 4)
+    encoding = mocker.Mock()
+    encoding.encode_ordinary.side_effect = str.split
+    executor_map = mocker.spy(_token_count_executor, "map")
+
+    assert _count_tokens(encoding, ["a b", "c d e", "f"]) == len("abcdef")
+    executor_map.assert_called_once_with(encoding.encode_ordinary, ["a b", "c d e", "f"])
+    encoding.encode_ordinary_batch.assert_not_called()
+
+
+def test_estimate_tokens_extrapolates_past_exact_limit(mocker: MockerFixture) -> None:
+    """Test that ``_estimate_tokens`` stops encoding past the exact limit and extrapolates the remaining chunks."""
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_THREADS", 1)
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_BATCH_SIZE", 1)
+    mocker.patch("gitingest.output_formatter._TOKEN_COUNT_EXACT_CHARS", 4)
+    encoding = mocker.Mock()
+    encoding.encode_ordinary.side_effect = str.split
+
+    # "a b" and "c d" are encoded (4 tokens in 6 characters), the 12 remaining characters count as 8 tokens
+    assert _estimate_tokens(encoding, iter(["a b", "c d", "e f g h", "ijklm"])) == 4 + 8
+    assert encoding.encode_ordinary.call_args_list == [mocker.call("a b"), mocker.call("c d")]